@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import pathlib
-
 from kivy.animation import Animation
-from kivy.lang.builder import Builder
 from kivy.properties import AliasProperty
 from kivy.uix.slider import Slider
 
+from ubo_gui.utils import load_kv
+
 
 class AnimatedSlider(Slider):
     """A slider that moves up and down when its value is changed."""
@@ -49,6 +48,4 @@ class AnimatedSlider(Slider):
         self.value = self.animated_value
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('animated_slider.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'animated_slider.kv')
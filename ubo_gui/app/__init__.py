@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import pathlib
 from functools import cached_property
 from typing import TYPE_CHECKING, cast
 
@@ -14,6 +13,7 @@ from kivy.properties import StringProperty
 from kivy.uix.label import Label
 
 from ubo_gui import FONTS_PATH
+from ubo_gui.utils import kv_path
 
 LabelBase.register(
     name=DEFAULT_FONT,
@@ -46,9 +46,7 @@ class UboApp(App):
         """
         self.root: RootWidget = cast(
             RootWidget,
-            Builder.load_file(
-                pathlib.Path(__file__).parent.joinpath('app.kv').resolve().as_posix(),
-            ),
+            Builder.load_file(kv_path(__file__, 'app.kv')),
         )
 
         central_layout: BoxLayout = self.root.ids.central_layout
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import pathlib
-
-from kivy.lang.builder import Builder
 from kivy.properties import ColorProperty, ListProperty, NumericProperty, StringProperty
 from kivy.uix.boxlayout import BoxLayout
 
+from ubo_gui.utils import load_kv
+
 
 class GaugeWidget(BoxLayout):
     """A widget that displays a gauge."""
@@ -23,6 +22,4 @@ class GaugeWidget(BoxLayout):
     _pos = ListProperty([0, 0])
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('gauge_widget.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'gauge_widget.kv')
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import threading
+from collections import deque
 from functools import cached_property
-from typing import Any, NotRequired, TypedDict
+from typing import Any
 
 from kivy.clock import mainthread
 from kivy.uix.screenmanager import (
@@ -18,17 +19,10 @@ from kivy.uix.screenmanager import (
 )
 
 
-class SwitchParameters(TypedDict):
-    """Parameters for switching screens."""
-
-    duration: NotRequired[float | None]
-    direction: NotRequired[str | None]
-
-
 class TransitionsMixin:
     """Provides easy access to different transitions."""
 
-    transition_queue: list[
+    transition_queue: deque[
         tuple[Screen | None, TransitionBase, str | None, float | None]
     ]
     screen_manager: ScreenManager
@@ -40,7 +34,7 @@ class TransitionsMixin:
         """Initialize the transitions mixin."""
         _ = kwargs
         self._transition_progress_lock = threading.Lock()
-        self.transition_queue = []
+        self.transition_queue = deque()
 
     def _handle_transition_progress(
         self: TransitionsMixin,
@@ -58,31 +52,26 @@ class TransitionsMixin:
         transition.screen_in.opacity = 1
         with self._transition_progress_lock:
             if self.transition_queue:
-                (
-                    (screen, transition, direction, duration),
-                    *self.transition_queue,
-                ) = self.transition_queue
+                screen, transition, direction, duration = (
+                    self.transition_queue.popleft()
+                )
                 if (
                     len(self.transition_queue) > 1
                     and transition is not self._no_transition
                 ):
                     duration = 0.08
-                switch_parameters: SwitchParameters = {}
-                if duration is not None:
-                    switch_parameters['duration'] = duration
-                if direction is not None:
-                    switch_parameters['direction'] = direction
                 self._perform_switch(
                     screen,
                     transition=transition,
-                    **switch_parameters,
+                    duration=duration,
+                    direction=direction,
                 )
             else:
                 self._is_transition_in_progress = False
 
     def _setup_transition(self: TransitionsMixin, transition: TransitionBase) -> None:
-        transition.bind(on_progress=self._handle_transition_progress)
-        transition.bind(on_complete=self._handle_transition_complete)
+        transition.fbind('on_progress', self._handle_transition_progress)
+        transition.fbind('on_complete', self._handle_transition_complete)
 
     @cached_property
     def _no_transition(self: TransitionsMixin) -> NoTransition:
@@ -144,10 +133,9 @@ class TransitionsMixin:
             duration = 0 if transition is self._no_transition else 0.3
         with self._transition_progress_lock:
             if self._is_transition_in_progress:
-                self.transition_queue = [
-                    *self.transition_queue,
+                self.transition_queue.append(
                     (screen, transition, direction, duration),
-                ]
+                )
             else:
                 self._is_transition_in_progress = transition is not self._no_transition
                 self._is_preparation_in_progress = True
@@ -8,15 +8,12 @@ Each item can optionally be styled differently.
 
 from __future__ import annotations
 
-import math
-import pathlib
+import itertools
 import threading
-import uuid
 import warnings
 from typing import TYPE_CHECKING, cast, overload
 
 from kivy.clock import mainthread
-from kivy.lang.builder import Builder
 from kivy.properties import (
     AliasProperty,
     BooleanProperty,
@@ -29,6 +26,7 @@ from kivy.uix.screenmanager import Screen, ScreenManager, TransitionBase
 from ubo_gui.logger import logger
 from ubo_gui.menu._transitions import TransitionsMixin
 from ubo_gui.page import PageWidget
+from ubo_gui.utils import load_kv, mainthread_if_needed
 
 from .constants import PAGE_SIZE
 from .stack_item import (
@@ -42,7 +40,6 @@ from .types import (
     ActionItem,
     ApplicationItem,
     HeadedMenu,
-    HeadlessMenu,
     Item,
     Menu,
     SubMenuItem,
@@ -57,6 +54,13 @@ if TYPE_CHECKING:
 
     from ubo_gui.animated_slider import AnimatedSlider
 
+SNAPSHOT_START = ('╭', '│', '│', '│', '╰')
+SNAPSHOT_END = ('╮', '│', '│', '│', '╯')
+SNAPSHOT_CROSS = tuple(
+    row * (VISUAL_SNAPSHOT_WIDTH // 3)
+    for row in ('───', '╲ ╱', ' ╳ ', '╱ ╲', '───')  # noqa: RUF001
+)
+
 
 class MenuWidget(BoxLayout, TransitionsMixin):
     """Paginated menu."""
@@ -69,6 +73,9 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
     _current_menu_items: Sequence[Item]
     _current_screen: Screen | None = None
+    _rendered_top: StackItem | None = None
+    # Used to give each opened application a unique screen name
+    _application_counter = itertools.count()
     _title: str | None = None
     screen_manager: ScreenManager
     slider: AnimatedSlider
@@ -82,7 +89,7 @@ class MenuWidget(BoxLayout, TransitionsMixin):
         self.screen_subscriptions_lock = threading.Lock()
         self.stack_lock = threading.Lock()
         super().__init__(**kwargs)
-        self.bind(stack=self._render)
+        self.fbind('stack', self._render)
 
     def __del__(self: MenuWidget) -> None:
         """Clear all subscriptions."""
@@ -122,20 +129,21 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
         If it is already the last page, rotate to the first page.
         """
-        if self.current_application:
-            self.current_application.go_down()
+        application = self.current_application
+        if application:
+            application.go_down()
             return
 
-        if self.pages == 1:
+        pages = self.pages
+        if pages == 1:
             return
 
-        if self.current_menu:
+        menu = self.current_menu
+        if menu:
             menu_page = cast(PageWidget, self.current_screen)
 
-            menu_page.clone.page_index = self.page_index = (
-                self.page_index + 1
-            ) % self.pages
-            menu_page.clone.items = self._menu_items(self.current_menu)
+            menu_page.clone.page_index = self.page_index = (self.page_index + 1) % pages
+            menu_page.clone.items = self._menu_items(menu)
 
             self._switch_to(
                 menu_page.clone,
@@ -150,20 +158,21 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
         If it is already the first page, rotate to the last page.
         """
-        if self.current_application:
-            self.current_application.go_up()
+        application = self.current_application
+        if application:
+            application.go_up()
             return
 
-        if self.pages == 1:
+        pages = self.pages
+        if pages == 1:
             return
 
-        if self.current_menu:
+        menu = self.current_menu
+        if menu:
             menu_page = cast(PageWidget, self.current_screen)
 
-            menu_page.clone.page_index = self.page_index = (
-                self.page_index - 1
-            ) % self.pages
-            menu_page.clone.items = self._menu_items(self.current_menu)
+            menu_page.clone.page_index = self.page_index = (self.page_index - 1) % pages
+            menu_page.clone.items = self._menu_items(menu)
 
             self._switch_to(
                 menu_page.clone,
@@ -351,7 +360,7 @@ class MenuWidget(BoxLayout, TransitionsMixin):
                 if isinstance(item, StackApplicationItem):
                     item.application.dispatch('on_close')
             self.root.selection = None
-            self.stack = self.stack[:1]
+            del self.stack[1:]
             self._switch_to(
                 self.current_screen,
                 transition=self._rise_in_transition,
@@ -427,6 +436,7 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
         if isinstance(self.current_menu, HeadedMenu):
 
+            @mainthread_if_needed
             def handle_heading_change(heading: str) -> None:
                 logger.debug(
                     'Handle `heading` change...',
@@ -445,6 +455,7 @@ class MenuWidget(BoxLayout, TransitionsMixin):
             if subscription:
                 self.menu_subscriptions.add(subscription)
 
+            @mainthread_if_needed
             def handle_sub_heading_change(sub_heading: str) -> None:
                 logger.debug(
                     'Handle `sub_heading` change...',
@@ -465,11 +476,52 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
         return list_widget
 
+    @mainthread_if_needed
+    def _update_menu_page(
+        self: MenuWidget,
+        top: StackMenuItem,
+        menu_page: MenuPageWidget,
+        items: Sequence[Item],
+    ) -> None:
+        """Render new items of the current menu in its already rendered page."""
+        if self._rendered_top is not top:
+            return
+        menu = top.menu
+        self.current_menu_items = items
+        last_page_index = self.pages - 1
+        if self.page_index > last_page_index:
+            self.page_index = last_page_index
+            menu_page.page_index = menu_page.clone.page_index = last_page_index
+        # Bursts of updates are coalesced by the page, which renders its items
+        # once per frame
+        menu_page.items = menu_page.clone.items = self._menu_items(menu)
+        menu_page.clone.placeholder = menu_page.placeholder
+
+    def _build_menu_page(
+        self: MenuWidget,
+        menu: Menu,
+        items: Sequence[Item],
+    ) -> MenuPageWidget:
+        """Render the page of the current menu and make it the current screen."""
+        self.current_menu_items = items
+        self._clear_menu_subscriptions()
+        menu_page = self._render_menu(menu)
+        # The clone here is solely needed for the visual transitions between
+        # menu pages, when `page_index` increases or decreases, the slide
+        # down/up transition needs a source and a target. So a clone of the
+        # original page is needed. If `ScreenManager` supported transition
+        # from a screen to itself we probably wouldn't need this.
+        menu_page.clone = self._render_menu(menu)
+        menu_page.clone.clone = menu_page
+        self.current_screen = menu_page
+        return menu_page
+
     def _render_menu_item(self: MenuWidget) -> None:
         if not isinstance(self.top, StackMenuItem):
             return
 
-        menu = self.top.menu
+        top = self.top
+        menu = top.menu
         last_items = None
         menu_page: MenuPageWidget | None = None
         placeholder = None
@@ -484,34 +536,26 @@ class MenuWidget(BoxLayout, TransitionsMixin):
                     'subscription_level': 'screen',
                 },
             )
-            self.current_menu_items = items
-            if menu_page is None:
-                self._clear_menu_subscriptions()
-                menu_page = self._render_menu(menu)
-                # The clone here is solely needed for the visual transitions between
-                # menu pages, when `page_index` increases or decreases, the slide
-                # down/up transition needs a source and a target. So a clone of the
-                # original page is needed. If `ScreenManager` supported transition
-                # from a screen to itself we probably wouldn't need this.
-                menu_page.clone = self._render_menu(menu)
-                menu_page.clone.clone = menu_page
-                self.current_screen = menu_page
-            else:
-                if self.page_index >= self.pages:
-                    menu_page.page_index = self.page_index = self.pages - 1
-                    menu_page.clone.page_index = self.page_index = self.pages - 1
-                menu_page.items = self._menu_items(menu)
-                menu_page.clone.items = self._menu_items(menu)
-            menu_page.placeholder = placeholder
-            menu_page.clone.placeholder = placeholder
             last_items = items
+            if menu_page is not None:
+                self._update_menu_page(top, menu_page, items)
+                return
+            # The first emission renders the page synchronously, so the caller of
+            # `_render` can switch to it right away. It is not marshalled to the main
+            # thread, so if it is notified from another thread, the pages are built
+            # in that thread.
+            menu_page = self._build_menu_page(menu, items)
+            menu_page.placeholder = menu_page.clone.placeholder = placeholder
 
         subscription = process_subscribable_value(menu.items, handle_items_change)
         if subscription:
             self.screen_subscriptions.add(subscription)
 
+        @mainthread_if_needed
         def handle_placeholder_change(new_placeholder: str | None) -> None:
             nonlocal placeholder
+            if self._rendered_top is not top:
+                return
             logger.debug(
                 'Handle `placeholder` change...',
                 extra={
@@ -533,9 +577,16 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
     def _render(self: MenuWidget, *_: object) -> None:
         """Return the current screen page."""
+        top = self.stack[-1] if self.stack else None
+        # Changes below the top of the stack, like closing an application which is
+        # not on top, don't need the current screen to be rendered again
+        if top is self._rendered_top:
+            return
+        self._rendered_top = top
+
         self._clear_screen_subscriptions()
 
-        if not self.stack:
+        if top is None:
             return
 
         title = None
@@ -547,7 +598,10 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
             title = self.top.menu.title
 
+        @mainthread_if_needed
         def handle_title_change(title: str | None) -> None:
+            if self._rendered_top is not top:
+                return
             logger.debug(
                 'Handle `title` change...',
                 extra={
@@ -583,7 +637,7 @@ class MenuWidget(BoxLayout, TransitionsMixin):
     ) -> None:
         """Open an application."""
         with self.stack_lock:
-            application.name = uuid.uuid4().hex
+            application.name = f'Application {next(self._application_counter)}'
             application.padding_bottom = self.padding_bottom
             application.padding_top = self.padding_top
             self._push(
@@ -601,28 +655,27 @@ class MenuWidget(BoxLayout, TransitionsMixin):
         # If any of these applications are the top of the stack, remove it with `pop` to
         # ensure the animation is played.
         with self.stack_lock:
-            to_be_removed = [
-                cast(StackApplicationItem, item)
-                for item in self.stack
+            top = self.top
+            is_top_removed = False
+            stack: list[StackItem] = []
+            for item in self.stack:
                 if any(
-                    isinstance(item, StackApplicationItem)
-                    and item.application is application
-                    for item in item.lineage
-                )
-            ]
-
-            for item in to_be_removed:
-                if item is not self.top:
-                    item.clear_subscriptions()
-                    item.application.dispatch('on_close')
-
-            self.stack = [
-                item
-                for item in self.stack
-                if item not in to_be_removed or item is self.top
-            ]
-
-            if self.top in to_be_removed:
+                    isinstance(ancestor, StackApplicationItem)
+                    and ancestor.application is application
+                    for ancestor in item.lineage
+                ):
+                    if item is top:
+                        is_top_removed = True
+                    else:
+                        item.clear_subscriptions()
+                        if isinstance(item, StackApplicationItem):
+                            item.application.dispatch('on_close')
+                        continue
+                stack.append(item)
+
+            self.stack = stack
+
+            if is_top_removed:
                 self._pop()
 
     @property
@@ -643,68 +696,53 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
     @property
     def _visual_snapshot(self: MenuWidget) -> list[str]:
-        start = [
-            '╭',
-            '│',
-            '│',
-            '│',
-            '╰',
-        ]
-        end = [
-            '╮',
-            '│',
-            '│',
-            '│',
-            '╯',
-        ]
-
-        cross_repeats = VISUAL_SNAPSHOT_WIDTH // 3
-        cross = [
-            '───' * cross_repeats,
-            '╲ ╱' * cross_repeats,  # noqa: RUF001
-            ' ╳ ' * cross_repeats,  # noqa: RUF001
-            '╱ ╲' * cross_repeats,  # noqa: RUF001
-            '───' * cross_repeats,
-        ]
-
-        def append(item: list[str]) -> None:
-            for i in range(5):
-                output[-(5 - i)] += item[i] if i < len(item) else ' ' * len(item[0])
-
-        output = []
+        output: list[str] = []
+        # Rows of the band being built, each row is joined once the band is complete
+        rows: list[list[str]] = []
+
+        def flush() -> None:
+            output.extend(''.join(row) for row in rows)
+            rows[:] = [[] for _ in range(5)]
+
+        def append(item: Sequence[str]) -> None:
+            padding = ' ' * len(item[0])
+            for i, row in enumerate(rows):
+                row.append(item[i] if i < len(item) else padding)
+
         for start_item in range(0, len(self.stack), 5):
-            output.extend([''] * 5)
-            for item in self.stack[start_item : min(start_item + 5, len(self.stack))]:
-                append(start)
+            items = self.stack[start_item : start_item + 5]
+
+            flush()
+            for item in items:
+                append(SNAPSHOT_START)
                 append(item.visual_snapshot)
-            append(end)
+            append(SNAPSHOT_END)
             append(
                 [
                     f' {type(item).__name__} {item.title[:VISUAL_SNAPSHOT_WIDTH]} '
-                    for item in self.stack[
-                        start_item : min(start_item + 5, len(self.stack))
-                    ]
+                    for item in items
                 ],
             )
 
-            output.extend([''] * 5)
-            for item in self.stack[start_item : min(start_item + 5, len(self.stack))]:
-                append(start)
-                append(item.parent.visual_snapshot if item.parent else cross)
-            append(end)
+            flush()
+            for item in items:
+                append(SNAPSHOT_START)
+                append(item.parent.visual_snapshot if item.parent else SNAPSHOT_CROSS)
+            append(SNAPSHOT_END)
 
-            output.extend([''] * 5)
-            for item in self.stack[start_item : min(start_item + 5, len(self.stack))]:
-                append(start)
+            flush()
+            for item in items:
+                append(SNAPSHOT_START)
                 append(
                     item.selection.item.visual_snapshot
                     if isinstance(item, StackMenuItem) and item.selection
-                    else cross,
+                    else SNAPSHOT_CROSS,
                 )
-            append(end)
+            append(SNAPSHOT_END)
         if len(self.stack) % 5 != 0:
             for _ in range(5 - (len(self.stack) % 5)):
                 append([' ' * (VISUAL_SNAPSHOT_WIDTH + 1)] * 5)
+        flush()
 
         return output
 
@@ -719,22 +757,15 @@ class MenuWidget(BoxLayout, TransitionsMixin):
         if stack_item not in self.stack:
             msg = '`stack_item` not found in stack'
             raise ValueError(msg) from None
+        selection: SubMenuItem | None = None
         if stack_item.selection:
-            items = [
-                item
-                for item in (menu.items() if callable(menu.items) else menu.items)
-                if isinstance(item, SubMenuItem)
-                and item.key == stack_item.selection.key
-            ]
-            if len(items) == 1:
-                selection = items[0]
-            elif len(items) > 1:
-                msg = f'Found more than one item with key: {stack_item.selection.key}'
-                raise ValueError(msg)
-            else:
-                selection = None
-        else:
-            selection = None
+            key = stack_item.selection.key
+            for item in menu.items() if callable(menu.items) else menu.items:
+                if isinstance(item, SubMenuItem) and item.key == key:
+                    if selection is not None:
+                        msg = f'Found more than one item with key: {key}'
+                        raise ValueError(msg)
+                    selection = item
         index = self.stack.index(stack_item)
         new_item = self.stack[index] = StackMenuItem(
             menu=menu,
@@ -808,7 +839,7 @@ class MenuWidget(BoxLayout, TransitionsMixin):
         if isinstance(parent, StackMenuItem) and isinstance(new_top, StackMenuItem):
             parent.selection = StackMenuItemSelection(key=key or '', item=new_top)
 
-        self.stack = [*self.stack, new_top]
+        self.stack.append(new_top)
 
         self._switch_to(
             self.current_screen,
@@ -839,7 +870,7 @@ class MenuWidget(BoxLayout, TransitionsMixin):
         if isinstance(popping_item.parent, StackMenuItem):
             popping_item.parent.selection = None
 
-        *self.stack, _ = self.stack
+        self.stack.pop()
 
         target = self.top
 
@@ -866,19 +897,17 @@ class MenuWidget(BoxLayout, TransitionsMixin):
     def _clear_menu_subscriptions(self: MenuWidget) -> None:
         """Clear widget subscriptions."""
         with self.menu_subscriptions_lock:
-            subscriptions = self.menu_subscriptions.copy()
-            self.menu_subscriptions.clear()
-            for unsubscribe in subscriptions:
-                unsubscribe()
+            subscriptions, self.menu_subscriptions = self.menu_subscriptions, set()
+        for unsubscribe in subscriptions:
+            unsubscribe()
 
     def _clear_screen_subscriptions(self: MenuWidget) -> None:
         """Clear screen subscriptions."""
         # lock the mutex to do it atomic
         with self.screen_subscriptions_lock:
-            subscriptions = self.screen_subscriptions.copy()
-            self.screen_subscriptions.clear()
-            for unsubscribe in subscriptions:
-                unsubscribe()
+            subscriptions, self.screen_subscriptions = self.screen_subscriptions, set()
+        for unsubscribe in subscriptions:
+            unsubscribe()
 
     def get_current_application(self: MenuWidget) -> PageWidget | None:
         """Return the current application."""
@@ -909,11 +938,11 @@ class MenuWidget(BoxLayout, TransitionsMixin):
 
     def get_pages(self: MenuWidget) -> int:
         """Return the number of pages of the currently active menu."""
-        if isinstance(self.current_menu, HeadedMenu):
-            return max(math.ceil((len(self.current_menu_items) + 2) / 3), 1)
-        if isinstance(self.current_menu, HeadlessMenu):
-            return max(math.ceil(len(self.current_menu_items) / 3), 1)
-        return 0
+        menu = self.current_menu
+        if menu is None:
+            return 0
+        # Integer form of `ceil((count + heading_size) / 3)`
+        return max((len(self.current_menu_items) + menu.heading_size + 2) // 3, 1)
 
     def get_current_menu_items(self: MenuWidget) -> Sequence[Item] | None:
         """Return current menu items."""
@@ -982,6 +1011,4 @@ class MenuWidget(BoxLayout, TransitionsMixin):
         return '\n'.join(self._visual_snapshot)
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('menu.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'menu.kv')
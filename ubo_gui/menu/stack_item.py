@@ -14,6 +14,14 @@ if TYPE_CHECKING:
     from .types import Menu
 
 VISUAL_SNAPSHOT_WIDTH = 15
+VISUAL_SNAPSHOT_BLANK = ' ' * VISUAL_SNAPSHOT_WIDTH
+VISUAL_SNAPSHOT_BORDER = '─' * VISUAL_SNAPSHOT_WIDTH
+
+T = TypeVar('T', bound=str | Sequence | None)
+
+
+def _process_callable(object_: T | Callable[[], T]) -> T:
+    return object_() if callable(object_) else object_
 
 
 @dataclass(kw_only=True)
@@ -25,17 +33,17 @@ class BaseStackItem:
 
     def clear_subscriptions(self: BaseStackItem) -> None:
         """Clear all subscriptions."""
-        subscriptions = self.subscriptions.copy()
-        self.subscriptions.clear()
+        subscriptions, self.subscriptions = self.subscriptions, set()
         for unsubscribe in subscriptions:
             unsubscribe()
 
     @property
     def root(self: BaseStackItem) -> BaseStackItem:
         """Return the root item."""
-        if self.parent:
-            return self.parent.root
-        return self
+        item = self
+        while item.parent:
+            item = item.parent
+        return item
 
     @property
     def lineage(self: BaseStackItem) -> Generator[BaseStackItem, None, None]:
@@ -70,38 +78,29 @@ class StackMenuItem(BaseStackItem):
     @property
     def title(self: StackMenuItem) -> str:
         """Return the title of the menu."""
-        return self.menu.title() if callable(self.menu.title) else self.menu.title
+        return _process_callable(self.menu.title)
 
     @property
     def visual_snapshot(self: StackMenuItem) -> list[str]:
         """Return the snapshot of the menu."""
-        T = TypeVar('T', bound=str | Sequence | None)
-
-        def process_callable(object_: T | Callable[[], T]) -> T:
-            return object_() if callable(object_) else object_
-
-        items = process_callable(self.menu.items)
-        title = process_callable(self.menu.title)[: VISUAL_SNAPSHOT_WIDTH - 2]
-        padding = '─' * ((VISUAL_SNAPSHOT_WIDTH - len(title)) // 2)
+        items = _process_callable(self.menu.items)
+        title = _process_callable(self.menu.title)[: VISUAL_SNAPSHOT_WIDTH - 2]
+        rows = [
+            (
+                (_process_callable(item.icon) or ' ')
+                + ' '
+                + str(_process_callable(item.label))
+            ).ljust(VISUAL_SNAPSHOT_WIDTH, ' ')[:VISUAL_SNAPSHOT_WIDTH]
+            for item in items[:3]
+        ]
         return [
-            padding
-            + title
-            + padding
-            + '─' * ((len(title) + VISUAL_SNAPSHOT_WIDTH) % 2),
-            *(
-                (
-                    (process_callable(items[i].icon) or ' ')
-                    + ' '
-                    + str(process_callable(items[i].label))
-                ).ljust(
-                    VISUAL_SNAPSHOT_WIDTH,
-                    ' ',
-                )[:VISUAL_SNAPSHOT_WIDTH]
-                if len(items) > i
-                else ' ' * VISUAL_SNAPSHOT_WIDTH
-                for i in range(3)
+            ('─' * ((VISUAL_SNAPSHOT_WIDTH - len(title)) // 2) + title).ljust(
+                VISUAL_SNAPSHOT_WIDTH,
+                '─',
             ),
-            '─' * VISUAL_SNAPSHOT_WIDTH,
+            *rows,
+            *[VISUAL_SNAPSHOT_BLANK] * (3 - len(rows)),
+            VISUAL_SNAPSHOT_BORDER,
         ]
 
 
@@ -123,11 +122,11 @@ class StackApplicationItem(BaseStackItem):
         padding = '─' * ((VISUAL_SNAPSHOT_WIDTH - len(title)) // 2)
         return [
             padding + title + padding + '─' * (len(title) % 2),
-            ' ' * VISUAL_SNAPSHOT_WIDTH,
+            VISUAL_SNAPSHOT_BLANK,
             f""" {(self.application.title or '-').ljust(VISUAL_SNAPSHOT_WIDTH - 2, " ")
             [:VISUAL_SNAPSHOT_WIDTH - 2]} """,
-            ' ' * VISUAL_SNAPSHOT_WIDTH,
-            '─' * VISUAL_SNAPSHOT_WIDTH,
+            VISUAL_SNAPSHOT_BLANK,
+            VISUAL_SNAPSHOT_BORDER,
         ]
 
 
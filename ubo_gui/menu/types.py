@@ -2,16 +2,7 @@
 
 from __future__ import annotations
 
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    Generic,
-    Protocol,
-    TypeAlias,
-    TypeGuard,
-    cast,
-    overload,
-)
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Protocol, cast
 
 from immutable import Immutable
 from typing_extensions import TypeVar
@@ -20,6 +11,7 @@ from ubo_gui.constants import PRIMARY_COLOR
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
+    from typing import TypeAlias, TypeGuard, overload
 
     from kivy.graphics.context_instructions import Color
 
@@ -45,6 +37,9 @@ class BaseMenu(Immutable):
     items: Sequence[Item] | Callable[[], Sequence[Item]]
     placeholder: str | None | Callable[[], str | None] = None
 
+    # Number of item slots the heading takes in the first page
+    heading_size: ClassVar[int]
+
 
 class HeadedMenu(BaseMenu):
     """A class used to represent a headed menu.
@@ -64,10 +59,14 @@ class HeadedMenu(BaseMenu):
     heading: str | Callable[[], str]
     sub_heading: str | Callable[[], str]
 
+    heading_size: ClassVar[int] = 2
+
 
 class HeadlessMenu(BaseMenu):
     """A class used to represent a headless menu."""
 
+    heading_size: ClassVar[int] = 0
+
 
 Menu: TypeAlias = HeadedMenu | HeadlessMenu
 
@@ -79,7 +78,8 @@ def menu_items(menu: Menu | None) -> Sequence[Item]:
     """
     if not menu:
         return []
-    return menu.items() if callable(menu.items) else menu.items
+    items = menu.items
+    return items() if callable(items) else items
 
 
 class Item(Immutable):
@@ -194,16 +194,21 @@ def is_subscribeable(value: T | Callable[[], T]) -> TypeGuard[Subscribable[T]]:
     return callable(value) and hasattr(value, 'subscribe')
 
 
-@overload
-def process_subscribable_value(
-    value: T | Callable[[], T],
-    callback: Callable[[T], None],
-) -> Callable[[], None] | None: ...
-@overload
-def process_subscribable_value(
-    value: T | None | Callable[[], T | None],
-    callback: Callable[[T | None], None],
-) -> Callable[[], None] | None: ...
+if TYPE_CHECKING:
+    # The overloads only matter to type checkers, so they are not defined at runtime
+
+    @overload
+    def process_subscribable_value(
+        value: T | Callable[[], T],
+        callback: Callable[[T], None],
+    ) -> Callable[[], None] | None: ...
+    @overload
+    def process_subscribable_value(
+        value: T | None | Callable[[], T | None],
+        callback: Callable[[T | None], None],
+    ) -> Callable[[], None] | None: ...
+
+
 def process_subscribable_value(
     value: T | None | Callable[[], T],
     callback: Callable[[T], None],
@@ -212,11 +217,13 @@ def process_subscribable_value(
 
     in case it's a function, the return value of the function is called.
     """
-    if is_subscribeable(value):
-        return cast(Subscribable[T], value).subscribe(callback)
-    processed_value = cast(
-        T,
-        value() if callable(value) and not isinstance(value, type) else value,
-    )
-    callback(processed_value)
+    processed_value: object = value
+    if callable(value):
+        # A single lookup both checks for `subscribe` and gets the bound method
+        subscribe = getattr(value, 'subscribe', None)
+        if subscribe is not None:
+            return subscribe(callback)
+        if not isinstance(value, type):
+            processed_value = value()
+    callback(cast('T', processed_value))
     return None
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import pathlib
+import functools
+import weakref
 from typing import TYPE_CHECKING, Any
 
-from kivy.lang.builder import Builder
 from kivy.properties import (
     BooleanProperty,
     ColorProperty,
@@ -14,9 +14,11 @@ from kivy.properties import (
     StringProperty,
 )
 from kivy.uix.boxlayout import BoxLayout
+from kivy.utils import get_color_from_hex
 
 from ubo_gui.constants import PRIMARY_COLOR
 from ubo_gui.menu.types import process_subscribable_value
+from ubo_gui.utils import load_kv, mainthread_if_needed
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -25,6 +27,54 @@ if TYPE_CHECKING:
 
     from ubo_gui.menu.types import Item
 
+DEFAULT_COLOR = (1, 1, 1, 1)
+DEFAULT_BACKGROUND_COLOR = tuple(get_color_from_hex(PRIMARY_COLOR))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_hex_color(value: str) -> tuple[float, ...]:
+    return tuple(get_color_from_hex(value))
+
+
+def _normalize_color(value: Any, default: tuple[float, ...]) -> Any:  # noqa: ANN401
+    """Return the color, parsing hex strings once instead of on every assignment.
+
+    Hex colors, like the default `Item.background_color`, would otherwise be parsed
+    by `ColorProperty` each time they are assigned, color names are left to it.
+    """
+    if not value:
+        return default
+    if isinstance(value, str) and value.startswith('#'):
+        return _parse_hex_color(value)
+    return value
+
+
+# `Item` fields mirrored by `ItemWidget` properties, each with a function mapping the
+# field value to the property value, filling in the default for unset values
+ITEM_FIELDS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ('label', lambda value: value or ''),
+    ('is_short', bool),
+    ('color', lambda value: _normalize_color(value, DEFAULT_COLOR)),
+    (
+        'background_color',
+        lambda value: _normalize_color(value, DEFAULT_BACKGROUND_COLOR),
+    ),
+    ('icon', lambda value: value or ''),
+)
+
+
+def _set_field(
+    widget_ref: weakref.ReferenceType[ItemWidget],
+    item: Item,
+    field: str,
+    normalize: Callable[[Any], Any],
+    value: object,
+) -> None:
+    """Set a field of the widget if it is alive and still shows `item`."""
+    widget = widget_ref()
+    if widget is not None and widget.item is item:
+        setattr(widget, field, normalize(value))
+
 
 class ItemWidget(BoxLayout):
     """Renders an `Item`.
@@ -49,8 +99,8 @@ class ItemWidget(BoxLayout):
 
     is_set: bool = BooleanProperty(defaultvalue=False)
     label: str = StringProperty()
-    color: Color = ColorProperty((1, 1, 1, 1))
-    background_color: Color = ColorProperty(PRIMARY_COLOR)
+    color: Color = ColorProperty(DEFAULT_COLOR)
+    background_color: Color = ColorProperty(DEFAULT_BACKGROUND_COLOR)
     icon: str = StringProperty(defaultvalue='')
     is_short: bool = BooleanProperty(defaultvalue=False)
     item: Item | None = ObjectProperty(allownone=True)
@@ -76,61 +126,43 @@ class ItemWidget(BoxLayout):
             self.is_set = False
         else:
             self.is_set = True
-            self.label = ''
-            subscription = process_subscribable_value(
-                value.label,
-                lambda value: setattr(self, 'label', value or ''),
-            )
-            if subscription:
-                self._subscriptions.append(subscription)
-
-            self.is_short = False
-            subscription = process_subscribable_value(
-                value.is_short,
-                lambda value: setattr(
-                    self,
-                    'is_short',
-                    False if value is None else value,
-                ),
-            )
-            if subscription:
-                self._subscriptions.append(subscription)
-
-            self.color = ItemWidget.color.defaultvalue
-            subscription = process_subscribable_value(
-                value.color,
-                lambda value: setattr(
-                    self,
-                    'color',
-                    value or ItemWidget.color.defaultvalue,
-                ),
-            )
-            if subscription:
-                self._subscriptions.append(subscription)
-
-            self.background_color = ItemWidget.background_color.defaultvalue
-            subscription = process_subscribable_value(
-                value.background_color,
-                lambda value: setattr(
-                    self,
-                    'background_color',
-                    value or ItemWidget.background_color.defaultvalue,
-                ),
-            )
-            if subscription:
-                self._subscriptions.append(subscription)
-
-            self.icon = ''
-            subscription = process_subscribable_value(
-                value.icon,
-                lambda value: setattr(self, 'icon', value or ''),
-            )
-            if subscription:
-                self._subscriptions.append(subscription)
+            # Subscribers only hold a weak reference, so the publisher of a field
+            # does not keep the widget alive
+            widget_ref = weakref.ref(self)
+            # Most item fields are plain values, assign them directly and only go
+            # through `process_subscribable_value` for callables.
+            for field, normalize in ITEM_FIELDS:
+                field_value = getattr(value, field)
+                if callable(field_value):
+                    setattr(self, field, normalize(None))
+                    self._subscribe(
+                        field_value,
+                        functools.partial(
+                            _set_field,
+                            widget_ref,
+                            value,
+                            field,
+                            normalize,
+                        ),
+                    )
+                else:
+                    setattr(self, field, normalize(field_value))
 
             self.opacity = value.opacity or 1
             self.progress = min(max(value.progress or 1, 0), 1)
 
+    def _subscribe(
+        self: ItemWidget,
+        value: Callable[[], Any],
+        callback: Callable[[Any], None],
+    ) -> None:
+        subscription = process_subscribable_value(
+            value,
+            mainthread_if_needed(callback),
+        )
+        if subscription:
+            self._subscriptions.append(subscription)
+
     def clear_subscriptions(self: ItemWidget) -> None:
         """Clear the subscriptions."""
         for subscription in self._subscriptions:
@@ -138,6 +170,4 @@ class ItemWidget(BoxLayout):
         self._subscriptions.clear()
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('item_widget.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'item_widget.kv')
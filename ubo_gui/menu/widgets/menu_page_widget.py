@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import pathlib
 import warnings
 from typing import TYPE_CHECKING, Any
 
-from kivy.lang.builder import Builder
+from kivy.clock import Clock
 from kivy.properties import AliasProperty, NumericProperty, StringProperty
 
 from ubo_gui.menu.widgets.item_widget import ItemWidget
 from ubo_gui.page import PageWidget
+from ubo_gui.utils import load_kv
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -34,16 +34,27 @@ class MenuPageWidget(PageWidget):
     has_heading: bool = AliasProperty(
         getter=get_has_heading,
         bind=('heading', 'sub_heading', 'page_index'),
+        cache=True,
     )
 
-    @property
-    def head_size(self: MenuPageWidget) -> int:
+    def get_head_size(self: MenuPageWidget) -> int:
         """Return the size of the header."""
         return HEADER_SIZE if self.has_heading else 0
 
-    @property
-    def _count(self: MenuPageWidget) -> int:
-        return super()._count - self.head_size
+    head_size: int = AliasProperty(
+        getter=get_head_size,
+        bind=('has_heading',),
+        cache=True,
+    )
+
+    def _get_count(self: MenuPageWidget) -> int:
+        return super()._get_count() - self.head_size
+
+    _count: int = AliasProperty(
+        getter=_get_count,
+        bind=('count', 'render_surroundings', 'head_size'),
+        cache=True,
+    )
 
     def __init__(
         self: MenuPageWidget,
@@ -69,34 +80,39 @@ class MenuPageWidget(PageWidget):
         self.bind(heading=self.adjust_item_widgets)
         self.bind(sub_heading=self.adjust_item_widgets)
         self.bind(page_index=self.adjust_item_widgets)
-        self.bind(items=self.render)
+        # Several changes of `items` in the same frame result in a single render
+        self.bind(items=Clock.create_trigger(self.render, -1))
 
     def adjust_item_widgets(self: MenuPageWidget, *args: object) -> None:
         """Initialize the widget."""
         _ = args
-        offset = self._offset if self.has_heading else 0
-        for _ in range(len(self.item_widgets), self._count - offset):
-            self.item_widgets.append(ItemWidget(size_hint=(1, None)))
-            self.ids.layout.add_widget(self.item_widgets[-1])
-        for _ in range(self._count - offset, len(self.item_widgets)):
-            self.ids.layout.remove_widget(self.item_widgets[-1])
-            del self.item_widgets[-1]
+        item_widgets = self.item_widgets
+        layout = self.ids.layout
+        target = self._count - (self._offset if self.has_heading else 0)
+        for _ in range(len(item_widgets), target):
+            item_widget = ItemWidget(size_hint=(1, None))
+            item_widgets.append(item_widget)
+            layout.add_widget(item_widget)
+        for item_widget in item_widgets[target:]:
+            layout.remove_widget(item_widget)
+        del item_widgets[target:]
         self.render()
 
     def render(self: MenuPageWidget, *_: object) -> None:
         """Render the item widgets."""
-        if not self.item_widgets:
+        item_widgets = self.item_widgets
+        if not item_widgets:
             return
-        if self.has_heading:
-            for i in range(self._offset, self._count):
-                self.item_widgets[i - self._offset].item = (
-                    self.items[i] if i < len(self.items) else None
-                )
-        else:
-            for i in range(self._count):
-                self.item_widgets[i].item = (
-                    self.items[i] if i < len(self.items) else None
-                )
+        offset = self._offset if self.has_heading else 0
+        page_items = self.items[offset : self._count]
+        # Rows showing the very same item are skipped, so they don't go through the
+        # equality check of the `item` property
+        for item_widget, item in zip(item_widgets, page_items, strict=False):
+            if item_widget.item is not item:
+                item_widget.item = item
+        for item_widget in item_widgets[len(page_items) :]:
+            if item_widget.item is not None:
+                item_widget.item = None
 
     def get_item(self: MenuPageWidget, index: int) -> Item | None:
         """Get the item at the given index."""
@@ -113,6 +129,4 @@ class MenuPageWidget(PageWidget):
             return None
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('menu_page_widget.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'menu_page_widget.kv')
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-import pathlib
-
-from kivy.lang.builder import Builder
 from kivy.metrics import dp
 from kivy.properties import ColorProperty, StringProperty
 
 from ubo_gui.page import PageWidget
+from ubo_gui.utils import load_kv
 
 
 class NotificationWidget(PageWidget):
@@ -28,9 +26,4 @@ class NotificationWidget(PageWidget):
         self.ids.slider.animated_value += dp(50)
 
 
-Builder.load_file(
-    pathlib.Path(__file__)
-    .parent.joinpath('notification_widget.kv')
-    .resolve()
-    .as_posix(),
-)
+load_kv(__file__, 'notification_widget.kv')
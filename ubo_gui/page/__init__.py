@@ -41,18 +41,33 @@ class PageWidget(Screen):
 
     def get_is_empty(self: PageWidget) -> bool:
         """Check if there is no item in items or all of them are `None`."""
-        return all(i is None for i in self.items)
+        # Items are always truthy, so only `None` entries are falsy
+        return not any(self.items)
 
-    is_empty: bool = AliasProperty(getter=get_is_empty, bind=('items',))
+    is_empty: bool = AliasProperty(
+        getter=get_is_empty,
+        bind=('items',),
+        cache=True,
+    )
 
-    @property
-    def _count(self: PageWidget) -> int:
+    def _get_count(self: PageWidget) -> int:
         return self.count + (2 if self.render_surroundings else 0)
 
-    @property
-    def _offset(self: PageWidget) -> int:
+    _count: int = AliasProperty(
+        getter=_get_count,
+        bind=('count', 'render_surroundings'),
+        cache=True,
+    )
+
+    def _get_offset(self: PageWidget) -> int:
         return 1 if self.render_surroundings else 0
 
+    _offset: int = AliasProperty(
+        getter=_get_offset,
+        bind=('render_surroundings',),
+        cache=True,
+    )
+
     def go_up(self: Self) -> None:
         """Implement this method to provide custom logic for up key."""
         return
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import pathlib
-
-from kivy.lang.builder import Builder
 from kivy.metrics import dp
 from kivy.properties import ColorProperty, NumericProperty
 from kivy.uix.widget import Widget
 
+from ubo_gui.utils import load_kv
+
 
 class ProgressRingWidget(Widget):
     """renders a progress ring."""
@@ -22,9 +21,4 @@ class ProgressRingWidget(Widget):
     _progress: int = NumericProperty()
 
 
-Builder.load_file(
-    pathlib.Path(__file__)
-    .parent.joinpath('progress_ring_widget.kv')
-    .resolve()
-    .as_posix(),
-)
+load_kv(__file__, 'progress_ring_widget.kv')
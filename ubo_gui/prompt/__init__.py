@@ -5,12 +5,10 @@ A widget that renders a prompt with two options.
 
 from __future__ import annotations
 
-import pathlib
 import warnings
 from abc import ABC, ABCMeta, abstractmethod
 from typing import TYPE_CHECKING
 
-from kivy.lang.builder import Builder
 from kivy.properties import (
     AliasProperty,
     BooleanProperty,
@@ -22,6 +20,7 @@ from kivy.uix.widget import WidgetMetaclass
 from ubo_gui.constants import DANGER_COLOR, SUCCESS_COLOR
 from ubo_gui.menu.types import ActionItem
 from ubo_gui.page import PageWidget
+from ubo_gui.utils import load_kv
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -116,6 +115,7 @@ class PromptWidget(PageWidget, ABC, metaclass=PromptWidgetMetaClass):
         getter=_items_getter,
         setter=_items_setter,
         bind=['first_item', 'second_item'],
+        cache=True,
     )
 
     @abstractmethod
@@ -148,6 +148,4 @@ class PromptWidget(PageWidget, ABC, metaclass=PromptWidgetMetaClass):
         return self.first_item if index == 1 else self.second_item
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('prompt_widget.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'prompt_widget.kv')
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
-import io
+import functools
 
 import qrcode
-from kivy.core.image import Image as CoreImage
+from kivy.graphics.texture import Texture
 from kivy.properties import OptionProperty, StringProperty
 from kivy.uix.image import Image
 
 
+@functools.lru_cache(maxsize=32)
+def _render_qrcode(content: str) -> tuple[int, bytes]:
+    """Return the size and the luminance pixels of the QR code of `content`.
+
+    Recent ones are cached as they repeat often.
+    """
+    qr = qrcode.QRCode(version=1, border=1)
+    qr.add_data(content)
+    qr.make()
+    matrix = qr.get_matrix()
+    # Textures start from the bottom row, dark modules are black and light ones white
+    pixels = bytes(0 if cell else 255 for row in reversed(matrix) for cell in row)
+    return len(matrix), pixels
+
+
 class QRCodeWidget(Image):
     """A widget to display a QR code."""
 
@@ -21,13 +36,10 @@ class QRCodeWidget(Image):
 
     def on_content(self: QRCodeWidget, _: QRCodeWidget, value: str) -> None:
         """Handle the `content` property change."""
-        img = qrcode.make(value, version=1, border=1)
-
-        data = io.BytesIO()
-        img.save(data)
-        data.seek(0)
-
-        core_image = CoreImage(data, ext='png')
-        texture = core_image.texture
+        size, pixels = _render_qrcode(value)
+        texture = Texture.create(size=(size, size), colorfmt='luminance')
+        texture.blit_buffer(pixels, colorfmt='luminance', bufferfmt='ubyte')
+        # Scale up the modules of the code without blurring their edges
+        texture.mag_filter = 'nearest'
 
         self.texture = texture
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import pathlib
 import re
 
 from kivy.animation import Animation
-from kivy.lang.builder import Builder
 from kivy.properties import NumericProperty
 from kivy.uix.label import Label
 
+from ubo_gui.utils import load_kv
+
+MARKUP_TAG_PATTERN = re.compile(r'\[(?P<tag>\w+)=.*?\](?P<text>.*?)\[/\1\]')
+
 
 class SpinnerWidget(Label):
     """Spinner widget for loading indication."""
@@ -27,18 +29,17 @@ class SpinnerWidget(Label):
             duration=0,
         )
         self.rotation_animation.repeat = True
-        self.bind(text=self.handle_text_change)
+        self.fbind('text', self.handle_text_change)
         self.handle_text_change(self, self.text)
 
     def handle_text_change(self: SpinnerWidget, _: SpinnerWidget, text: str) -> None:
         """Decide whether to show the spinner or not."""
-        text = re.sub(r'\[(?P<tag>\w+)=.*?\](?P<text>.*?)\[/\1\]', r'\g<text>', text)
+        if '[' in text:
+            text = MARKUP_TAG_PATTERN.sub(r'\g<text>', text)
         if text == '':
             self.rotation_animation.start(self)
         else:
             self.rotation_animation.cancel(self)
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('spinner_widget.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'spinner_widget.kv')
@@ -0,0 +1,55 @@
+"""Utility functions shared by ubo-gui widgets."""
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from typing import TYPE_CHECKING, ParamSpec
+
+from kivy.clock import mainthread
+from kivy.lang.builder import Builder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+P = ParamSpec('P')
+
+# The main thread never changes, comparing idents avoids `threading.current_thread()`
+MAIN_THREAD_ID = threading.main_thread().ident
+
+
+def mainthread_if_needed(func: Callable[P, None]) -> Callable[P, None]:
+    """Make `func` always run in the main thread.
+
+    Unlike `kivy.clock.mainthread`, if it is called in the main thread it runs
+    immediately instead of being scheduled for the next frame.
+    Calls from other threads run in a later frame, by then the state they update
+    may be stale, so `func` should check it is still current.
+    """
+    scheduled_func = mainthread(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
+        if threading.get_ident() == MAIN_THREAD_ID:
+            func(*args, **kwargs)
+        else:
+            scheduled_func(*args, **kwargs)
+
+    return wrapper
+
+
+@functools.cache
+def kv_path(module_file: str, name: str) -> str:
+    """Return the path of the kv file `name` next to the module `module_file`."""
+    return os.path.join(os.path.dirname(module_file), name)  # noqa: PTH118, PTH120
+
+
+def load_kv(module_file: str, name: str) -> None:
+    """Load the kv file `name` next to the module `module_file`, only once.
+
+    Loading a kv file again would add duplicate rules, applied to every new widget.
+    """
+    path = kv_path(module_file, name)
+    if path not in Builder.files:
+        Builder.load_file(path)
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-import pathlib
-
-from kivy.lang.builder import Builder
 from kivy.properties import ColorProperty, NumericProperty
 from kivy.uix.boxlayout import BoxLayout
 
 from ubo_gui.constants import PRIMARY_COLOR, SECONDARY_COLOR
+from ubo_gui.utils import load_kv
 
 
 class VolumeWidget(BoxLayout):
@@ -19,6 +17,4 @@ class VolumeWidget(BoxLayout):
     background_color = ColorProperty(SECONDARY_COLOR)
 
 
-Builder.load_file(
-    pathlib.Path(__file__).parent.joinpath('volume_widget.kv').resolve().as_posix(),
-)
+load_kv(__file__, 'volume_widget.kv')